@@ -5,30 +5,236 @@ Extracts latest real-time sensor data from Awair Omni and Kaiterra Sensedge Mini
 Outputs consolidated data to a single CSV file.
 """
 
-import requests
-import pandas as pd
-import time
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import asyncio
+import csv
+import logging
+import os
+import sys
+from collections import deque
+import aiohttp
+import msgspec
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+from datetime import datetime, timezone
+from typing import List, Dict, Any, AsyncIterator, Callable, Optional, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+# Per-request timeouts shared by both vendor APIs. Applied to connecting and
+# reading only (no total budget), so time spent queued for a free pooled
+# connection does not count against a request
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=10)
+
+# Maximum number of pooled keep-alive connections shared by both extractors
+CONNECTION_POOL_SIZE = 32
+
+# Seconds an idle pooled connection is kept open; longer than the Awair
+# rate-limit window so connections survive limiter and retry waits
+CONNECTION_KEEPALIVE_TIMEOUT = 75
+
+
+def _create_session() -> aiohttp.ClientSession:
+    """
+    Create a persistent HTTP session with keep-alive connection pooling.
+    
+    The session carries no provider headers, so a single instance (one DNS
+    cache and one connection pool) can be shared by both extractors.
+    
+    Returns:
+        Configured aiohttp client session
+    """
+    connector = aiohttp.TCPConnector(limit=CONNECTION_POOL_SIZE, keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT)
+    return aiohttp.ClientSession(timeout=REQUEST_TIMEOUT, connector=connector)
+
+
+# HTTP status codes worth retrying (rate limiting and transient server errors)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """
+    Decide whether a failed request should be retried.
+    
+    Args:
+        exc: Exception raised by the request
+        
+    Returns:
+        True for retryable HTTP statuses, connection errors and timeouts
+    """
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status in RETRYABLE_STATUS_CODES
+    return isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+# Retry transient failures with jittered exponential backoff; the final
+# exception is re-raised so callers still record an Error row
+_retry_transient = retry(
+    wait=wait_exponential_jitter(initial=1, max=30),
+    stop=stop_after_attempt(4),
+    retry=retry_if_exception(_is_transient_error),
+    reraise=True
+)
+
+
+class _SlidingWindowLimiter:
+    """
+    Async rate limiter allowing at most `max_requests` in any rolling `period`.
+    
+    Send times are kept in a deque; a caller only waits once the window already
+    holds `max_requests` sends, and then only until the oldest one expires.
+    Waiters are served in arrival order.
+    """
+    
+    def __init__(self, max_requests: int, period: float):
+        """
+        Initialize the limiter.
+        
+        Args:
+            max_requests: Maximum requests allowed within the window
+            period: Window length in seconds
+        """
+        self.max_requests = max_requests
+        self.period = period
+        self._sent = deque()
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self) -> None:
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                while self._sent and now - self._sent[0] >= self.period:
+                    self._sent.popleft()
+                if len(self._sent) < self.max_requests:
+                    break
+                await asyncio.sleep(self.period - (now - self._sent[0]))
+            self._sent.append(now)
+    
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+
+async def _fetch(session: aiohttp.ClientSession, url: str, headers: Dict[str, str],
+                 decode: Callable[[bytes], Any]) -> Tuple[int, Any]:
+    """
+    Perform a GET request and decode the JSON body.
+    
+    Args:
+        session: Shared HTTP session
+        url: Fully qualified endpoint URL
+        headers: Provider authentication headers for this request
+        decode: Function turning the raw response body into the returned payload
+        
+    Returns:
+        Tuple of (HTTP status code, decoded JSON payload)
+        
+    Raises:
+        aiohttp.ClientResponseError: If the server returns a 4xx/5xx status
+    """
+    async with session.get(url, headers=headers) as response:
+        response.raise_for_status()
+        return response.status, decode(await response.read())
+
+
+# Placeholder for optional raw sections; decodes as JSON null, which no schema accepts
+_RAW_NULL = msgspec.Raw(b"null")
+
+
+def _decode_entry(decoder: msgspec.json.Decoder, raw: msgspec.Raw) -> Optional[Any]:
+    """
+    Decode a single raw response entry, skipping it if it does not match the schema.
+    
+    Response sections and entries are kept as msgspec.Raw and decoded one at a
+    time through this helper, so a malformed one only costs its own cells
+    rather than the whole device.
+    
+    Args:
+        decoder: Typed decoder for the entry
+        raw: Undecoded JSON for the entry
+        
+    Returns:
+        Decoded struct, or None if the entry is malformed
+    """
+    try:
+        return decoder.decode(raw)
+    except msgspec.ValidationError:
+        return None
+
+
+class AwairSensor(msgspec.Struct):
+    """Single entry of the Awair `sensors` array."""
+    
+    comp: Union[str, int, float, None] = "unknown"
+    value: Any = None
+
+
+class AwairResponse(msgspec.Struct):
+    """Awair latest air-data response; unknown fields are ignored during decoding."""
+    
+    timestamp: Any = None
+    score: Any = None
+    sensors: List[msgspec.Raw] = []
+
+
+# Top-level decoder for the response envelope; sensor entries are decoded
+# individually with _AWAIR_SENSOR_DECODER
+_AWAIR_DECODER = msgspec.json.Decoder(AwairResponse)
+_AWAIR_SENSOR_DECODER = msgspec.json.Decoder(AwairSensor)
 
 
 class AwairDataExtractor:
     """Handles data extraction from Awair Omni devices via Enterprise Dashboard API."""
     
     BASE_URL = "https://developer-apis.awair.is/v1/users/self/devices"
-    RATE_LIMIT_DELAY = 6  # seconds (10 requests per minute = 1 request per 6 seconds)
+    RATE_LIMIT_REQUESTS = 10  # requests allowed per rate-limit period
+    RATE_LIMIT_PERIOD = 60  # seconds (10 requests per minute)
+    
+    # Map sensor components to readable column names
+    SENSOR_MAPPING = {
+        "temp": "Temperature_°C",
+        "humid": "Humidity_%",
+        "co2": "CO2_ppm",
+        "voc": "VOC_ppb",
+        "pm25": "PM2.5_µg/m³",
+        "pm10": "PM10_µg/m³"
+    }
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, session: aiohttp.ClientSession):
         """
         Initialize Awair data extractor.
         
         Args:
             api_key: Awair API key for authentication
+            session: Shared HTTP session; its lifecycle is owned by the caller
         """
         self.api_key = api_key
+        self.session = session
         self.headers = {"x-api-key": api_key}
+        # Sliding window: only blocks once 10 requests were sent in the last 60 s
+        self._limiter = _SlidingWindowLimiter(self.RATE_LIMIT_REQUESTS, self.RATE_LIMIT_PERIOD)
+    
+    @_retry_transient
+    async def _request(self, url: str) -> Tuple[int, Any]:
+        """
+        Fetch an Awair endpoint, retrying transient failures.
+        
+        Every attempt, including retries, counts against the rate limiter.
+        
+        Args:
+            url: Fully qualified endpoint URL
+            
+        Returns:
+            Tuple of (HTTP status code, decoded AwairResponse)
+        """
+        async with self._limiter:
+            logger.debug("Fetching Awair endpoint: %s", url)
+            return await _fetch(self.session, url, self.headers, decode=_AWAIR_DECODER.decode)
     
-    def get_device_data(self, device_id: str) -> Dict[str, Any]:
+    # Do not @njit this parser. Numba typed-Dict operations on unicode keys are
+    # >40x slower than CPython dict operations (numba/numba#6439) and
+    # heterogeneous JSON dicts are unsupported (numba/numba#6461). The speedup
+    # comes from decoding straight into msgspec structs instead.
+    async def get_device_data(self, device_id: str) -> Dict[str, Any]:
         """
         Retrieve latest air quality data for a specific Awair device.
         
@@ -49,69 +255,119 @@ class AwairDataExtractor:
             # Awair API endpoint for latest data
             url = f"{self.BASE_URL}/omni/{device_id}/air-data/latest"
             
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            _, data = await self._request(url)
             
             # Parse timestamp
-            if "timestamp" in data:
-                result["Timestamp_UTC"] = data["timestamp"]
+            if data.timestamp is not None:
+                result["Timestamp_UTC"] = data.timestamp
             
             # Parse sensor data from nested sensors array
-            if "sensors" in data:
-                for sensor in data["sensors"]:
-                    comp = sensor.get("comp", "unknown")
-                    value = sensor.get("value")
-                    
-                    # Map sensor components to readable column names
-                    sensor_mapping = {
-                        "temp": "Temperature_°C",
-                        "humid": "Humidity_%",
-                        "co2": "CO2_ppm",
-                        "voc": "VOC_ppb",
-                        "pm25": "PM2.5_µg/m³",
-                        "pm10": "PM10_µg/m³"
-                    }
-                    
-                    column_name = sensor_mapping.get(comp, f"{comp}_value")
-                    result[column_name] = value
+            for raw_sensor in data.sensors:
+                sensor = _decode_entry(_AWAIR_SENSOR_DECODER, raw_sensor)
+                if sensor is None:
+                    continue
+                
+                column_name = self.SENSOR_MAPPING.get(sensor.comp)
+                if column_name is None:
+                    column_name = f"{sensor.comp}_value"
+                result[column_name] = sensor.value
             
             # Parse score if present
-            if "score" in data:
-                result["Awair_Score"] = data["score"]
+            if data.score is not None:
+                result["Awair_Score"] = data.score
                 
-        except requests.exceptions.HTTPError as e:
-            result["Error"] = f"HTTP Error: {e.response.status_code} - {e.response.reason}"
-        except requests.exceptions.RequestException as e:
-            result["Error"] = f"Request Error: {str(e)}"
+        except aiohttp.ClientResponseError as e:
+            result["Error"] = f"HTTP Error: {e.status} - {e.message}"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            result["Error"] = f"Request Error: {str(e) or type(e).__name__}"
         except Exception as e:
             result["Error"] = f"Parsing Error: {str(e)}"
         
         return result
     
-    def get_all_devices_data(self, device_ids: List[str]) -> List[Dict[str, Any]]:
+    async def get_all_devices_data(self, device_ids: List[str]) -> AsyncIterator[Dict[str, Any]]:
         """
         Retrieve data for all specified Awair devices with rate limiting.
         
         Args:
             device_ids: List of Awair device identifiers
             
-        Returns:
-            List of dictionaries containing device data
+        Yields:
+            Dictionary containing device data, in the order responses arrive
         """
-        all_data = []
-        
-        for i, device_id in enumerate(device_ids):
-            print(f"Fetching Awair device {i+1}/{len(device_ids)}: {device_id}")
-            device_data = self.get_device_data(device_id)
-            all_data.append(device_data)
-            
-            # Rate limiting: sleep after each request (except the last one)
-            if i < len(device_ids) - 1:
-                time.sleep(self.RATE_LIMIT_DELAY)
+        for device_data in asyncio.as_completed([self.get_device_data(device_id) for device_id in device_ids]):
+            yield await device_data
+
+
+class KaiterraSensorReading(msgspec.Struct):
+    """Single sensor reading from the Kaiterra `latest.data` section."""
+    
+    value: Any = None
+    units: Union[str, int, float, None] = ""
+
+
+class KaiterraAqiReading(msgspec.Struct):
+    """Single AQI value from the Kaiterra `latest.aqi` section."""
+    
+    value: Any = None
+
+
+class KaiterraLatest(msgspec.Struct):
+    """Latest readings section of a Kaiterra device response."""
+    
+    data: msgspec.Raw = _RAW_NULL
+    aqi: msgspec.Raw = _RAW_NULL
+
+
+class KaiterraAqiInfo(msgspec.Struct):
+    """AQI metadata carrying the reading timestamp."""
+    
+    ts: Any = None
+
+
+class KaiterraInfo(msgspec.Struct):
+    """Device info section of a Kaiterra device response."""
+    
+    aqi: msgspec.Raw = _RAW_NULL
+
+
+class KaiterraResponse(msgspec.Struct):
+    """Kaiterra device response; unknown fields are ignored during decoding."""
+    
+    info: msgspec.Raw = _RAW_NULL
+    latest: msgspec.Raw = _RAW_NULL
+
+
+# One decoder per level of the Kaiterra response, applied via _decode_entry
+_KAITERRA_DECODER = msgspec.json.Decoder(KaiterraResponse)
+_KAITERRA_INFO_DECODER = msgspec.json.Decoder(KaiterraInfo)
+_KAITERRA_AQI_INFO_DECODER = msgspec.json.Decoder(KaiterraAqiInfo)
+_KAITERRA_LATEST_DECODER = msgspec.json.Decoder(KaiterraLatest)
+_KAITERRA_SECTION_DECODER = msgspec.json.Decoder(Dict[str, msgspec.Raw])
+_KAITERRA_SENSOR_DECODER = msgspec.json.Decoder(KaiterraSensorReading)
+_KAITERRA_AQI_DECODER = msgspec.json.Decoder(KaiterraAqiReading)
+
+# Interned Kaiterra column names keyed by (base name, unit)
+_COLUMN_NAME_CACHE: Dict[Tuple[str, Union[str, int, float, None]], str] = {}
+
+
+def _column_name(base_name: str, unit: Union[str, int, float, None]) -> str:
+    """
+    Build a column name with its unit, reusing one interned string per pair.
+    
+    Args:
+        base_name: Readable sensor name (e.g. "PM2.5")
+        unit: Unit reported by the API, if any
         
-        return all_data
+    Returns:
+        Column name such as "PM2.5_µg/m³", or the base name when there is no unit
+    """
+    key = (base_name, unit)
+    column_name = _COLUMN_NAME_CACHE.get(key)
+    if column_name is None:
+        column_name = sys.intern(f"{base_name}_{unit}" if unit else base_name)
+        _COLUMN_NAME_CACHE[key] = column_name
+    return column_name
 
 
 class KaiterraDataExtractor:
@@ -119,17 +375,44 @@ class KaiterraDataExtractor:
     
     BASE_URL = "https://api.kaiterra.com/v1/lasereggs"
     
-    def __init__(self, api_key: str):
+    # Map sensor keys to readable column base names (units are appended per reading)
+    SENSOR_MAPPING = {
+        "pm25": "PM2.5",
+        "pm10": "PM10",
+        "tvoc": "TVOC",
+        "temp": "Temperature",
+        "humid": "Humidity",
+        "co2": "CO2"
+    }
+    
+    def __init__(self, api_key: str, session: aiohttp.ClientSession):
         """
         Initialize Kaiterra data extractor.
         
         Args:
             api_key: Kaiterra API key for authentication
+            session: Shared HTTP session; its lifecycle is owned by the caller
         """
         self.api_key = api_key
+        self.session = session
         self.headers = {"X-API-Key": api_key}
     
-    def get_device_data(self, device_id: str) -> Dict[str, Any]:
+    @_retry_transient
+    async def _request(self, url: str) -> Tuple[int, Any]:
+        """
+        Fetch a Kaiterra endpoint, retrying transient failures.
+        
+        Args:
+            url: Fully qualified endpoint URL
+            
+        Returns:
+            Tuple of (HTTP status code, decoded KaiterraResponse)
+        """
+        logger.debug("Fetching Kaiterra endpoint: %s", url)
+        return await _fetch(self.session, url, self.headers, decode=_KAITERRA_DECODER.decode)
+    
+    # Do not @njit this parser either; see AwairDataExtractor.get_device_data.
+    async def get_device_data(self, device_id: str) -> Dict[str, Any]:
         """
         Retrieve latest air quality data for a specific Kaiterra device.
         
@@ -150,116 +433,147 @@ class KaiterraDataExtractor:
             # Kaiterra API endpoint for latest data
             url = f"{self.BASE_URL}/{device_id}"
             
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            _, data = await self._request(url)
             
             # Parse timestamp
-            if "info" in data and "aqi" in data["info"] and "ts" in data["info"]["aqi"]:
-                result["Timestamp_UTC"] = data["info"]["aqi"]["ts"]
+            info = _decode_entry(_KAITERRA_INFO_DECODER, data.info)
+            if info is not None:
+                aqi_info = _decode_entry(_KAITERRA_AQI_INFO_DECODER, info.aqi)
+                if aqi_info is not None and aqi_info.ts is not None:
+                    result["Timestamp_UTC"] = aqi_info.ts
             
-            # Parse highly nested sensor data
-            if "latest" in data and "data" in data["latest"]:
-                sensor_data = data["latest"]["data"]
-                
+            latest = _decode_entry(_KAITERRA_LATEST_DECODER, data.latest)
+            if latest is not None:
                 # Extract each sensor reading with its unit
-                for sensor_key, sensor_info in sensor_data.items():
-                    if isinstance(sensor_info, dict):
-                        value = sensor_info.get("value")
-                        unit = sensor_info.get("units", "")
-                        
-                        # Create column name with unit
-                        sensor_mapping = {
-                            "pm25": "PM2.5",
-                            "pm10": "PM10",
-                            "tvoc": "TVOC",
-                            "temp": "Temperature",
-                            "humid": "Humidity",
-                            "co2": "CO2"
-                        }
-                        
-                        base_name = sensor_mapping.get(sensor_key, sensor_key.upper())
-                        column_name = f"{base_name}_{unit}" if unit else base_name
-                        result[column_name] = value
-            
-            # Parse AQI information if present
-            if "latest" in data and "aqi" in data["latest"]:
-                aqi_data = data["latest"]["aqi"]
-                if isinstance(aqi_data, dict):
-                    for aqi_key, aqi_info in aqi_data.items():
-                        if isinstance(aqi_info, dict) and "value" in aqi_info:
-                            result[f"AQI_{aqi_key.upper()}"] = aqi_info["value"]
+                sensor_data = _decode_entry(_KAITERRA_SECTION_DECODER, latest.data) or {}
+                for sensor_key, raw_reading in sensor_data.items():
+                    sensor_info = _decode_entry(_KAITERRA_SENSOR_DECODER, raw_reading)
+                    if sensor_info is None:
+                        continue
+                    
+                    base_name = self.SENSOR_MAPPING.get(sensor_key)
+                    if base_name is None:
+                        base_name = sensor_key.upper()
+                    
+                    # Create column name with unit
+                    result[_column_name(base_name, sensor_info.units)] = sensor_info.value
+                
+                # Parse AQI information if present
+                aqi_data = _decode_entry(_KAITERRA_SECTION_DECODER, latest.aqi) or {}
+                for aqi_key, raw_aqi in aqi_data.items():
+                    aqi_entry = _decode_entry(_KAITERRA_AQI_DECODER, raw_aqi)
+                    if aqi_entry is not None and aqi_entry.value is not None:
+                        result[f"AQI_{aqi_key.upper()}"] = aqi_entry.value
                             
-        except requests.exceptions.HTTPError as e:
-            result["Error"] = f"HTTP Error: {e.response.status_code} - {e.response.reason}"
-        except requests.exceptions.RequestException as e:
-            result["Error"] = f"Request Error: {str(e)}"
+        except aiohttp.ClientResponseError as e:
+            result["Error"] = f"HTTP Error: {e.status} - {e.message}"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            result["Error"] = f"Request Error: {str(e) or type(e).__name__}"
         except Exception as e:
             result["Error"] = f"Parsing Error: {str(e)}"
         
         return result
     
-    def get_all_devices_data(self, device_ids: List[str]) -> List[Dict[str, Any]]:
+    async def get_all_devices_data(self, device_ids: List[str]) -> AsyncIterator[Dict[str, Any]]:
         """
-        Retrieve data for all specified Kaiterra devices.
+        Retrieve data for all specified Kaiterra devices concurrently.
         
         Args:
             device_ids: List of Kaiterra device identifiers
             
-        Returns:
-            List of dictionaries containing device data
+        Yields:
+            Dictionary containing device data, in the order responses arrive
         """
-        all_data = []
-        
-        for i, device_id in enumerate(device_ids):
-            print(f"Fetching Kaiterra device {i+1}/{len(device_ids)}: {device_id}")
-            device_data = self.get_device_data(device_id)
-            all_data.append(device_data)
-        
-        return all_data
+        for device_data in asyncio.as_completed([self.get_device_data(device_id) for device_id in device_ids]):
+            yield await device_data
 
 
-def consolidate_and_export(awair_data: List[Dict[str, Any]], 
-                          kaiterra_data: List[Dict[str, Any]], 
-                          output_file: str = "latest_air_quality_data.csv") -> None:
+class CsvSink:
     """
-    Consolidate data from both sources and export to CSV.
+    Streams device records to disk as they arrive and writes the final CSV on close.
     
-    Args:
-        awair_data: List of dictionaries containing Awair device data
-        kaiterra_data: List of dictionaries containing Kaiterra device data
-        output_file: Name of the output CSV file
+    Records are spooled as JSON lines to `<output_file>.partial` and flushed one
+    at a time, so memory stays flat and an interrupted run keeps what it fetched.
+    The CSV header is the union of every column seen, which is only known once
+    all records are in; closing the sink rewrites the spool under that header.
     """
-    # Combine all data
-    all_data = awair_data + kaiterra_data
     
-    if not all_data:
-        print("Warning: No data to export.")
-        return
+    PRIORITY_COLUMNS = ("Source", "Device_ID", "Timestamp_UTC", "Error")
+    _PRIORITY_SET = frozenset(PRIORITY_COLUMNS)
+    PROGRESS_INTERVAL = 25  # records between progress log lines
+    
+    def __init__(self, output_file: str = "latest_air_quality_data.csv"):
+        """
+        Initialize the CSV sink.
+        
+        Args:
+            output_file: Name of the output CSV file
+        """
+        self.output_file = output_file
+        self.spool_file = f"{output_file}.partial"
+        self.total = 0
+        self.successful = 0
+        self._columns = set()
+        self._spool = None
     
-    # Create DataFrame
-    df = pd.DataFrame(all_data)
+    def __enter__(self) -> "CsvSink":
+        self._spool = open(self.spool_file, "wb")
+        return self
     
-    # Reorder columns to have common fields first
-    priority_columns = ["Source", "Device_ID", "Timestamp_UTC", "Error"]
-    other_columns = [col for col in df.columns if col not in priority_columns]
-    ordered_columns = priority_columns + sorted(other_columns)
+    def __exit__(self, *exc_info) -> None:
+        self._spool.close()
+        self._export()
     
-    # Reorder DataFrame columns
-    df = df[ordered_columns]
+    def write(self, row: Dict[str, Any]) -> None:
+        """
+        Spool a single device record and flush it to disk.
+        
+        Args:
+            row: Dictionary containing device data
+        """
+        self._spool.write(msgspec.json.encode(row) + b"\n")
+        self._spool.flush()
+        self._columns.update(row)
+        
+        self.total += 1
+        if row.get("Error") is None:
+            self.successful += 1
+        
+        # Aggregate progress instead of a line per device
+        if self.total % self.PROGRESS_INTERVAL == 0:
+            logger.info("Wrote %d device records to %s", self.total, self.spool_file)
+    
+    def _export(self) -> None:
+        """Rewrite the spooled records as a CSV with every column seen, then drop the spool."""
+        # Order columns to have common fields first, followed by every sensor column seen
+        fieldnames = list(self.PRIORITY_COLUMNS) + sorted(self._columns - self._PRIORITY_SET)
+        
+        # Columns missing from a row are left blank
+        with open(self.spool_file, "rb") as spool, \
+                open(self.output_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval="")
+            writer.writeheader()
+            for line in spool:
+                writer.writerow(msgspec.json.decode(line))
+        
+        os.remove(self.spool_file)
     
-    # Export to CSV
-    df.to_csv(output_file, index=False)
-    print(f"\n✓ Data exported successfully to: {output_file}")
-    print(f"  Total devices: {len(df)}")
-    print(f"  Successful: {len(df[df['Error'].isna()])}")
-    print(f"  Failed: {len(df[df['Error'].notna()])}")
+    async def drain(self, rows: AsyncIterator[Dict[str, Any]]) -> None:
+        """
+        Write every record from an asynchronous stream.
+        
+        Args:
+            rows: Asynchronous iterator of device records
+        """
+        async for row in rows:
+            self.write(row)
 
 
-def main():
+async def main():
     """Main execution function."""
     
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    
     # Import configuration
     try:
         from config import AWAIR_API_KEY, KAITERRA_API_KEY, AWAIR_DEVICE_IDS, KAITERRA_DEVICE_IDS
@@ -271,38 +585,47 @@ def main():
     print("="*60)
     print("Air Quality Data Extractor")
     print("="*60)
-    print(f"Start time: {datetime.utcnow().isoformat()}Z\n")
+    print(f"Start time: {datetime.now(timezone.utc).isoformat()}\n")
     
-    # Extract Awair data
-    awair_data = []
+    # Announce configured devices for each platform
     if AWAIR_DEVICE_IDS:
         print(f"Extracting data from {len(AWAIR_DEVICE_IDS)} Awair device(s)...")
-        awair_extractor = AwairDataExtractor(AWAIR_API_KEY)
-        awair_data = awair_extractor.get_all_devices_data(AWAIR_DEVICE_IDS)
-        print(f"✓ Awair extraction complete\n")
     else:
         print("No Awair devices configured.\n")
     
-    # Extract Kaiterra data
-    kaiterra_data = []
     if KAITERRA_DEVICE_IDS:
         print(f"Extracting data from {len(KAITERRA_DEVICE_IDS)} Kaiterra device(s)...")
-        kaiterra_extractor = KaiterraDataExtractor(KAITERRA_API_KEY)
-        kaiterra_data = kaiterra_extractor.get_all_devices_data(KAITERRA_DEVICE_IDS)
-        print(f"✓ Kaiterra extraction complete\n")
     else:
         print("No Kaiterra devices configured.\n")
     
-    # Consolidate and export
-    if awair_data or kaiterra_data:
-        print("Consolidating data and exporting to CSV...")
-        consolidate_and_export(awair_data, kaiterra_data)
-    else:
+    if not (AWAIR_DEVICE_IDS or KAITERRA_DEVICE_IDS):
         print("No devices configured. Please add device IDs to config.py")
+    else:
+        # Extract from both platforms concurrently; they share no state, and each
+        # record is spooled to disk as soon as its device responds
+        print("Streaming records to disk as devices respond...")
+        async with _create_session() as session:
+            awair_extractor = AwairDataExtractor(AWAIR_API_KEY, session=session)
+            kaiterra_extractor = KaiterraDataExtractor(KAITERRA_API_KEY, session=session)
+            with CsvSink() as sink:
+                await asyncio.gather(
+                    sink.drain(awair_extractor.get_all_devices_data(AWAIR_DEVICE_IDS)),
+                    sink.drain(kaiterra_extractor.get_all_devices_data(KAITERRA_DEVICE_IDS))
+                )
+        
+        if AWAIR_DEVICE_IDS:
+            print(f"✓ Awair extraction complete")
+        if KAITERRA_DEVICE_IDS:
+            print(f"✓ Kaiterra extraction complete")
+        
+        print(f"\n✓ Data exported successfully to: {sink.output_file}")
+        print(f"  Total devices: {sink.total}")
+        print(f"  Successful: {sink.successful}")
+        print(f"  Failed: {sink.total - sink.successful}")
     
-    print(f"\nEnd time: {datetime.utcnow().isoformat()}Z")
+    print(f"\nEnd time: {datetime.now(timezone.utc).isoformat()}")
     print("="*60)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())